@@ -26,6 +26,16 @@ BaseValidator: type[Validator] = extend(
     type_checker=_cellophane_type_checker,
 )
 
+_CONDITIONAL_KEYWORDS = frozenset(
+    {
+        "if",
+        "anyOf",
+        "oneOf",
+        "allOf",
+        "dependentSchemas",
+    },
+)
+
 NullValidator = create(
     meta_schema=BaseValidator.META_SCHEMA,
     type_checker=_cellophane_type_checker,
@@ -290,15 +300,9 @@ def _(schema: frozendict, _data: frozendict | None = None) -> list[Flag]:
     schema_thawed = util.unfreeze(schema)
     flags: dict[tuple[str, ...], Flag] = {}
 
-    while any(
-        keyword in (kw for node in util.map_nested_keys(schema_thawed) for kw in node)
-        for keyword in [
-            "if",
-            "anyOf",
-            "oneOf",
-            "allOf",
-            "dependentSchemas",
-        ]
+    # Map the keys once per pass, rather than once for every conditional keyword
+    while not _CONDITIONAL_KEYWORDS.isdisjoint(
+        kw for node in util.map_nested_keys(schema_thawed) for kw in node
     ):
         compiled = deepcopy(schema_thawed)
         compile_conditional = extend(
@@ -1,5 +1,6 @@
 """Utility functions for working with YAML configuration files"""
 
+from functools import cache
 from typing import Any
 
 from ruamel.yaml import YAML, CommentedMap, CommentToken
@@ -13,26 +14,32 @@ class _BLANK:
     """Represents a blank value in YAML"""
 
 
+@cache
+def _yaml() -> YAML:
+    """Round-trip YAML instance used by dump_yaml, created on first use"""
+    yaml = YAML(typ="rt")
+    # Representer for preserved dicts
+
+    yaml.representer.add_representer(
+        data.PreservedDict,
+        lambda dumper, data: dumper.represent_dict(data),
+    )
+    # Representer for null as ~
+    yaml.representer.add_representer(
+        type(None),
+        lambda dumper, *_: dumper.represent_scalar("tag:yaml.org,2002:null", "~"),
+    )
+    yaml.representer.add_representer(
+        _BLANK,
+        lambda dumper, *_: dumper.represent_scalar("tag:yaml.org,2002:null", ""),
+    )
+    return yaml
+
+
 def dump_yaml(data_: Any) -> str:
     """Dumps data to a YAML string"""
     with StringIO() as handle:
-        yaml = YAML(typ="rt")
-        # Representer for preserved dicts
-
-        yaml.representer.add_representer(
-            data.PreservedDict,
-            lambda dumper, data: dumper.represent_dict(data),
-        )
-        # Representer for null as ~
-        yaml.representer.add_representer(
-            type(None),
-            lambda dumper, *_: dumper.represent_scalar("tag:yaml.org,2002:null", "~"),
-        )
-        yaml.representer.add_representer(
-            _BLANK,
-            lambda dumper, *_: dumper.represent_scalar("tag:yaml.org,2002:null", ""),
-        )
-        yaml.dump(data_, handle)
+        _yaml().dump(data_, handle)
         return handle.getvalue()
 
 
@@ -1,7 +1,7 @@
 """Base container class for the Config, Sample, and Samples classes."""
 
 from copy import deepcopy
-from functools import reduce
+from functools import cache
 from typing import Any, Iterator, Mapping, Sequence
 
 from attrs import define, field, fields_dict
@@ -13,6 +13,12 @@ class PreservedDict(dict):
     """Dict subclass to allow dict inside Container"""
 
 
+@cache
+def _fields(cls: type) -> frozenset[str]:
+    # fields_dict builds a new dict on every call
+    return frozenset(fields_dict(cls))
+
+
 @define(init=False, slots=False)
 class Container(Mapping):
     """Base container class for the Config, Sample, and Samples classes.
@@ -45,7 +51,7 @@ class Container(Mapping):
         **kwargs: Any,
     ) -> None:
         _data = __data__ or {}
-        for key in [k for k in kwargs if k not in fields_dict(self.__class__)]:
+        for key in [k for k in kwargs if k not in _fields(self.__class__)]:
             _data[key] = kwargs.pop(key)
         self.__attrs_init__(*args, **kwargs)
         for k, v in _data.items():
@@ -58,6 +64,8 @@ class Container(Mapping):
         return instance
 
     def __contains__(self, key: str | Sequence[str]) -> bool:  # type: ignore[override]
+        if isinstance(key, str):
+            return key in self.__data__ or key in _fields(self.__class__)
         try:
             self[key]  # pylint: disable=pointless-statement]
             return True
@@ -65,7 +73,7 @@ class Container(Mapping):
             return False
 
     def __setattr__(self, name: str, value: Any) -> None:
-        if name not in fields_dict(self.__class__):
+        if name not in _fields(self.__class__):
             self[name] = value
         else:
             super().__setattr__(name, value)
@@ -74,30 +82,40 @@ class Container(Mapping):
         if isinstance(item, dict) and not isinstance(item, (Container, PreservedDict)):
             item = Container(item)
 
+        # Fast path for the common case of a single string key
+        if isinstance(key, str):
+            if key in _fields(self.__class__):
+                self.__setattr__(key, item)
+            elif key.isidentifier():
+                self.__data__[key] = item
+            else:
+                raise TypeError(f"Key {key} is not an string or a sequence of strings")
+            return
+
         match key:
-            case str(k) if k in fields_dict(self.__class__):
-                self.__setattr__(k, item)
-            case str(k) if k.isidentifier():
-                self.__data__[k] = item
             case (*k,) if all(isinstance(k_, str) for k_ in k):
-
-                def _set(d: dict, k: str) -> dict:
-                    if k not in d:
-                        d[k] = Container()
-                    return d[k]
-
-                reduce(_set, k[:-1], self.__data__)[k[-1]] = item
+                node = self.__data__
+                for k_ in k[:-1]:
+                    if k_ not in node:
+                        node[k_] = Container()
+                    node = node[k_]
+                node[k[-1]] = item
             case k:
                 raise TypeError(f"Key {k} is not an string or a sequence of strings")
 
     def __getitem__(self, key: str | Sequence[str]) -> Any:
+        # Fast path for the common case of a single string key
+        if isinstance(key, str):
+            if key in _fields(self.__class__):
+                return super().__getattribute__(key)
+            return self.__data__[key]
+
         match key:
-            case str(k) if k in fields_dict(self.__class__):
-                return super().__getattribute__(k)
-            case str(k):
-                return self.__data__[k]
             case (*k,):
-                return reduce(lambda d, k: d[k], k, self.__data__)
+                node = self.__data__
+                for k_ in k:
+                    node = node[k_]
+                return node
             case k:
                 raise TypeError(f"Key {k} is not a string or a sequence of strings")
 
@@ -111,9 +129,11 @@ class Container(Mapping):
 
     def __deepcopy__(self, memo: dict[int, Any]) -> Any:
         _instance = self.__class__(
-            **{deepcopy(k): deepcopy(self[k]) for k in fields_dict(self.__class__)},
+            **{k: deepcopy(self[k], memo) for k in _fields(self.__class__)},
         )
-        _instance.__data__ = deepcopy(self.__data__)
+        # Register the copy before copying data, so shared references are reused
+        memo[id(self)] = _instance
+        _instance.__data__ = deepcopy(self.__data__, memo)
         return _instance
 
     def __len__(self) -> int:
@@ -1,8 +1,9 @@
 """Sample and Samples class definitions."""
 
+import json
 from collections import UserList
-from contextlib import suppress
 from copy import deepcopy
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, ClassVar, Iterable, Literal, Sequence, TypeVar, Union, overload
 from uuid import UUID, uuid4
@@ -44,10 +45,23 @@ def _apply_mixins(
     mixins: Sequence[type],
     **kwargs: Any,
 ) -> type:
-    name_ = cls.__name__
     if not mixins:
         return cls
 
+    return _mixin_class(cls, (*mixins,), (*kwargs.items(),))
+
+
+@lru_cache(maxsize=32)
+def _mixin_class(
+    cls: type,
+    mixins: tuple[type, ...],
+    kwargs: tuple[tuple[str, Any], ...],
+) -> type:
+    # Cached, as unpickling a Sample/Samples calls _apply_mixins for every
+    # instance, and creating an attrs class is expensive. A wrapper only uses
+    # a few combinations, so the cache is bounded to avoid keeping classes
+    # from modules that have since been unloaded (eg. between test runs).
+    name_ = cls.__name__
     mixins_ = []
     for mixin in mixins:
         if getattr(mixin, "__slots__", None):
@@ -62,8 +76,8 @@ def _apply_mixins(
         mixins_.append(mixin)
 
     cls_ = make_class(name_, (), (*mixins_,), slots=False)
-    cls_._mixins = (*mixins,)  # type: ignore[attr-defined]
-    for k, v in kwargs.items():
+    cls_._mixins = mixins  # type: ignore[attr-defined]
+    for k, v in kwargs:
         setattr(cls_, k, v)
     return cls_
 
@@ -175,6 +189,14 @@ class Sample:  # type: ignore[no-untyped-def]
         kwargs = {"id": state.pop("id")}
         return (_reconstruct, (Sample, self._mixins, args, kwargs, state))
 
+    def __deepcopy__(self, memo: dict[int, Any]) -> "Sample":
+        # Bypass __init__, as the attributes are already converted
+        instance = object.__new__(self.__class__)
+        memo[id(self)] = instance
+        for k, v in self.__dict__.items():
+            object.__setattr__(instance, k, deepcopy(v, memo))
+        return instance
+
     def __and__(self, other: "Sample") -> "Sample":
         if self.uuid != other.uuid:
             raise MergeSamplesUUIDError
@@ -326,6 +348,14 @@ class Samples(UserList[S]):
         cls_kwargs = {"sample_class": self.sample_class}
         return (_reconstruct, (Samples, self._mixins, args, kwargs, state, cls_kwargs))
 
+    def __deepcopy__(self, memo: dict[int, Any]) -> "Samples":
+        # Bypass __init__, as the attributes are already converted
+        instance = object.__new__(self.__class__)
+        memo[id(self)] = instance
+        for k, v in self.__dict__.items():
+            object.__setattr__(instance, k, deepcopy(v, memo))
+        return instance
+
     def __or__(self, other: "Samples") -> "Samples":
         if self.__class__.__name__ != other.__class__.__name__:
             raise MergeSamplesTypeError(f"Cannot merge {self.__class__} with {other.__class__}")
@@ -347,15 +377,17 @@ class Samples(UserList[S]):
     @merge.register("data")
     @staticmethod
     def _merge_data(this: list[Sample], that: list[Sample]) -> list[Sample]:
+        # Index by UUID once instead of scanning both lists for every sample.
+        # Reversed so the first sample with a given UUID is kept.
+        this_ = {s.uuid: s for s in reversed(this)}
+        that_ = {s.uuid: s for s in reversed(that)}
         data: list[Sample] = []
-        for uuid in {s.uuid for s in (*this, *that)}:
-            this_, that_ = None, None
-            with suppress(StopIteration):
-                this_ = next(s for s in this if s.uuid == uuid)
-            with suppress(StopIteration):
-                that_ = next(s for s in that if s.uuid == uuid)
+        for uuid in dict.fromkeys(s.uuid for s in (*this, *that)):
+            this_sample, that_sample = this_.get(uuid), that_.get(uuid)
             data.append(
-                this_ & that_ if this_ and that_ else this_ or that_,  # type: ignore[arg-type]
+                this_sample & that_sample  # type: ignore[arg-type]
+                if this_sample and that_sample
+                else this_sample or that_sample,
             )
             # arg-type can be ignored because uuid is guaranteed
             # to be in at least one of the lists
@@ -369,10 +401,15 @@ class Samples(UserList[S]):
 
     @classmethod
     def from_file(cls, path: Path) -> "Samples":
-        """Get samples from a YAML file"""
+        """Get samples from a YAML (or JSON) file"""
         samples = []
-        yaml = YAML(typ="safe")
-        for sample in yaml.load(path):
+        if Path(path).suffix == ".json":
+            # JSON is valid YAML, but the json module parses it much faster
+            with open(path, encoding="utf-8") as handle:
+                data = json.load(handle)
+        else:
+            data = YAML(typ="safe").load(path)
+        for sample in data:
             _id = sample.pop("id")
             samples.append(
                 cls.sample_class(id=str(_id), **sample),  # type: ignore[call-arg]
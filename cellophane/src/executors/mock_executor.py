@@ -29,8 +29,9 @@ class MockExecutor(Executor, name="mock"):
         logger.debug(f"cmdline={' '.join(args)}")
         logger.debug(f"{uuid=!s}")
         logger.debug(f"{workdir=!s}")
-        for k, v in env.items():
-            logger.debug(f"env.{k}={v}")
+        if env:
+            # One record for all variables rather than one per variable
+            logger.debug("\n".join(f"env.{k}={v}" for k, v in env.items()))
         logger.debug(f"{os_env=}")
         logger.debug(f"{cpus=}")
         logger.debug(f"{memory=}")
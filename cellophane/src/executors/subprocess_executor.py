@@ -1,8 +1,8 @@
 """Executor using subprocess."""
 
 import os
-import shlex
 import subprocess as sp  # nosec
+from contextlib import ExitStack, suppress
 from logging import LoggerAdapter
 from pathlib import Path
 from typing import Any
@@ -35,36 +35,58 @@ class SubprocessExecutor(Executor, name="subprocess"):
         logdir = self.config.logdir / "subprocess"
         logdir.mkdir(parents=True, exist_ok=True)
 
-        with (
-            open(logdir / f"{uuid.hex}.out", "w", encoding="utf-8") as stdout,
-            open(logdir / f"{uuid.hex}.err", "w", encoding="utf-8") as stderr,
-        ):
+        # The log files are only written by the child, so there is no need to
+        # wrap the file descriptors in Python file objects
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+        with ExitStack() as stack:
+            stdout = os.open(logdir / f"{uuid.hex}.out", flags, 0o666)
+            stack.callback(os.close, stdout)
+            stderr = os.open(logdir / f"{uuid.hex}.err", flags, 0o666)
+            stack.callback(os.close, stderr)
             proc = sp.Popen(  # nosec
-                shlex.split(shlex.join(args)),
+                [*args],
                 cwd=workdir,
-                env=env | ({**os.environ} if os_env else {}),
+                env={**env, **os.environ} if os_env else env,
                 stdout=stdout,
                 stderr=stderr,
                 start_new_session=True,
             )
-            self.pids[uuid] = proc.pid
-            logger.debug(f"Started process (pid={proc.pid})")
-            returncode = proc.wait()
-            logger.debug(f"Process (pid={proc.pid}) exited with code {returncode}")
-            exit(returncode)
+        self.pids[uuid] = proc.pid
+        logger.debug(f"Started process (pid={proc.pid})")
+        returncode = proc.wait()
+        # The pid may be reused once the process has been reaped
+        del self.pids[uuid]
+        logger.debug(f"Process (pid={proc.pid}) exited with code {returncode}")
+        exit(returncode)
 
     def terminate_hook(self, uuid: UUID, logger: LoggerAdapter) -> int | None:
-        if uuid in self.pids:
+        if uuid not in self.pids:
+            return None
+
+        try:
             proc = psutil.Process(self.pids[uuid])
+            # Collect the whole tree up front, as children are re-parented
+            # (and no longer listed) once the parent exits
             children = proc.children(recursive=True)
-            logger.warning(f"Terminating process (pid={proc.pid})")
-            proc.terminate()
-            code = int(proc.wait())
-            logger.debug(f"Process (pid={proc.pid}) exited with code {code}")
-            for child in children:
-                logger.warning(f"Terminating orphan process (pid={child.pid})")
-                child.terminate()
-            psutil.wait_procs(children)
-            return code
-        else:
+        except psutil.NoSuchProcess:
             return None
+
+        logger.warning(f"Terminating process (pid={proc.pid})")
+        for child in children:
+            logger.warning(f"Terminating orphan process (pid={child.pid})")
+        procs = [proc, *children]
+        for proc_ in procs:
+            with suppress(psutil.NoSuchProcess):
+                proc_.terminate()
+
+        # Kill anything that ignores SIGTERM (eg. shells trapping it)
+        _, alive = psutil.wait_procs(procs, timeout=10)
+        for proc_ in alive:
+            logger.warning(f"Killing process (pid={proc_.pid})")
+            with suppress(psutil.NoSuchProcess):
+                proc_.kill()
+        psutil.wait_procs(alive, timeout=5)
+
+        code = getattr(proc, "returncode", None)
+        logger.debug(f"Process (pid={proc.pid}) exited with code {code}")
+        return code
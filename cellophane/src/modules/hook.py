@@ -23,6 +23,7 @@ class Hook:
     condition: Literal["always", "complete", "failed"]
     before: list[str]
     after: list[str]
+    logger: LoggerAdapter
 
     def __init__(
         self,
@@ -68,6 +69,7 @@ class Hook:
         self.__module__ = func.__module__
         self.name = func.__name__
         self.label = label or func.__name__
+        self.logger = LoggerAdapter(getLogger(), {"label": self.label})
         self.condition = condition
         self.func = staticmethod(func)
         self.when = when
@@ -82,7 +84,7 @@ class Hook:
         timestamp: str,
         cleaner: Cleaner,
     ) -> Samples:
-        logger = LoggerAdapter(getLogger(), {"label": self.label})
+        logger = self.logger
         logger.debug(f"Running {self.label} hook")
 
         with executor_cls(
@@ -128,19 +130,19 @@ def resolve_dependencies(
         list[Hook]: The hooks in the resolved order.
 
     """
-    deps = {
-        name: {
-            *[d for h in hooks if h.__name__ == name for d in h.after],
-            *[h.__name__ for h in hooks if name in h.before],
-        }
-        for name in {
-            *[n for h in hooks for n in h.before + h.after],
-            *[h.__name__ for h in hooks],
-        }
-    }
-
-    order = [*TopologicalSorter(deps).static_order()]
-    return [*sorted(hooks, key=lambda h: order.index(h.__name__))]
+    # Hooks without explicit dependencies only have the implicit sentinels,
+    # so any order is valid and the input order is kept
+    if all(h.before == ["after_all"] and h.after == ["before_all"] for h in hooks):
+        return [*hooks]
+
+    deps: dict[str, set[str]] = {}
+    for hook in hooks:
+        deps.setdefault(hook.__name__, set()).update(hook.after)
+        for name in hook.before:
+            deps.setdefault(name, set()).add(hook.__name__)
+
+    order = {n: i for i, n in enumerate(TopologicalSorter(deps).static_order())}
+    return [*sorted(hooks, key=lambda h: order[h.__name__])]
 
 
 def run_hooks(
@@ -1,5 +1,6 @@
 """Runners for executing functions as jobs."""
 
+from contextlib import suppress
 from functools import partial, reduce
 from logging import LoggerAdapter, getLogger
 from multiprocessing import Queue
@@ -8,7 +9,7 @@ from typing import Callable, Sequence
 
 from mpire import WorkerPool
 from mpire.exception import InterruptWorker
-from psutil import Process, TimeoutExpired
+from psutil import NoSuchProcess, Process, wait_procs
 
 from cellophane.src.cfg import Config
 from cellophane.src.cleanup import Cleaner, DeferredCleaner
@@ -177,15 +178,18 @@ def _cleanup(
     samples.output = set()
     for sample in samples:
         sample.fail(reason_)
-    for proc in Process().children(recursive=True):
-        try:
+    children = Process().children(recursive=True)
+    for proc in children:
+        with suppress(NoSuchProcess):
             logger.debug(f"Waiting for {proc.name()} ({proc.pid})")
             proc.terminate()
-            proc.wait(10)
-        except TimeoutExpired:
+    # Give all children a single shared grace period instead of 10s each
+    _, alive = wait_procs(children, timeout=10)
+    for proc in alive:
+        with suppress(NoSuchProcess):
             logger.warning(f"Killing unresponsive process {proc.name()} ({proc.pid})")
             proc.kill()
-            proc.wait()
+    wait_procs(alive)
 
 
 def start_runners(
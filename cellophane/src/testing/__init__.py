@@ -1,6 +1,10 @@
 """Testing utilities for Cellophane."""
 
-from .fixture import run_definition
+from .fixture import (
+    definition_coverage,
+    definition_tmp_path,
+    run_definition,
+)
 from .util import (
     create_structure,
     execute_from_structure,
@@ -10,6 +14,8 @@ from .util import (
 
 __all__ = [
     "create_structure",
+    "definition_coverage",
+    "definition_tmp_path",
     "execute_from_structure",
     "fail_from_click_result",
     "parametrize_from_yaml",
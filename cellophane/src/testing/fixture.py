@@ -1,17 +1,38 @@
 import logging
+from contextlib import chdir
 from pathlib import Path
 from typing import Callable, Iterator
+from uuid import uuid4
 
 from click.testing import CliRunner
-from pytest import FixtureRequest, LogCaptureFixture, fixture
+from coverage import Coverage
+from pytest import FixtureRequest, LogCaptureFixture, TempPathFactory, fixture
 from pytest_mock import MockerFixture
 
 from .util import create_structure, execute_from_structure
 
 
+@fixture(scope="session")
+def definition_tmp_path(tmp_path_factory: TempPathFactory) -> Path:
+    """Shared base directory for definition working directories."""
+    return tmp_path_factory.mktemp("definitions")
+
+
+@fixture(scope="module")
+def definition_coverage() -> Iterator[list[str]]:
+    """Collect coverage data from definition runs and combine it once."""
+    paths: list[str] = []
+    pwd = Path.cwd()
+    yield paths
+    if paths:
+        cov = Coverage(data_file=pwd / f".coverage.{uuid4()}")
+        cov.combine(data_paths=paths)
+
+
 @fixture()
 def run_definition(
-    tmp_path: Path,
+    definition_tmp_path: Path,
+    definition_coverage: list[str],
     caplog: LogCaptureFixture,
     request: FixtureRequest,
     mocker: MockerFixture,
@@ -20,30 +41,28 @@ def run_definition(
     _runner = CliRunner()
     _handlers = logging.getLogger().handlers.copy()
     _extenal_root = Path(request.fspath).parent  # type: ignore[attr-defined]
-    _pytest_pwd = Path.cwd()
 
     def inner(definition: dict) -> None:
-        with (
-            _runner.isolated_filesystem(tmp_path) as td,
-            caplog.at_level(logging.DEBUG),
-        ):
+        td = definition_tmp_path / uuid4().hex
+        td.mkdir()
+        with chdir(td), caplog.at_level(logging.DEBUG):
             create_structure(
-                root=Path(td),
+                root=td,
                 structure=definition.get("structure", {}),
                 external_root=_extenal_root,
                 external=definition.get("external"),
             )
             execute_from_structure(
-                root=Path(td),
+                root=td,
                 mocks=definition.get("mocks", {}),
-                args=definition.get("args"),
+                args=definition.get("_args", definition.get("args")),
                 caplog=caplog,
                 mocker=mocker,
                 runner=_runner,
                 exception=definition.get("exception"),
                 logs=definition.get("logs"),
                 output=definition.get("output"),
-                pwd=_pytest_pwd,
+                coverage_paths=definition_coverage,
             )
 
     yield inner
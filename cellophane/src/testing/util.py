@@ -3,9 +3,11 @@
 """Testing utilities for Cellophane."""
 
 import logging
+import os
 import sys
 import traceback
 from contextlib import suppress
+from functools import cache, lru_cache
 from pathlib import Path
 from typing import Any, Callable
 from uuid import uuid4
@@ -19,6 +21,12 @@ from ruamel.yaml import YAML
 import cellophane
 
 _YAML = YAML(typ="unsafe", pure=True)
+_NONE_REPR = repr(None)
+
+
+@cache
+def _resolve(path: Path) -> Path:
+    return path.resolve()
 
 
 def create_structure(
@@ -28,21 +36,34 @@ def create_structure(
     external: dict[str, str] | None = None,
 ) -> None:
     """Create a directory structure from definition YAML."""
-    (root / "modules").mkdir(parents=True, exist_ok=True)
-    (root / "schema.yaml").touch(exist_ok=True)
-    for path, content in structure.items():
-        if isinstance(content, dict):
-            (root / path).mkdir(parents=True, exist_ok=True)
-            create_structure(root / path, content, external_root)
-        else:
-            (root / path).write_text(content)
-            (root / path).chmod(0o755)
+    _root = os.fspath(root)
+    os.makedirs(os.path.join(_root, "modules"), exist_ok=True)
+    with open(os.path.join(_root, "schema.yaml"), "a", encoding="utf-8"):
+        pass
+    stack = [(_root, structure)]
+    while stack:
+        base, node = stack.pop()
+        for path, content in node.items():
+            target = os.path.join(base, path)
+            if isinstance(content, dict):
+                os.makedirs(target, exist_ok=True)
+                stack.append((target, content))
+            else:
+                with open(target, "w", encoding="utf-8") as handle:
+                    handle.write(content)
+                os.chmod(target, 0o755)
 
     for src, dst in (external or {}).items():
-        _src = Path(src)
-        if not _src.is_absolute():
-            _src = (external_root / src).resolve()
-        (root / dst).symlink_to(_src)
+        _src = os.path.normpath(_resolve(external_root) / src)
+        os.symlink(_src, os.path.join(_root, dst))
+
+
+def _flatten_args(args: dict[str, str | None] | None) -> list[str]:
+    """Extract --flag value pairs from args.
+
+    If a value is None, the flag is considered to be a flag without a value.
+    """
+    return [p for f in (args or {}).items() for p in f if p is not None]
 
 
 def fail_from_click_result(result: Result | None, reason: str) -> None:
@@ -63,19 +84,24 @@ def fail_from_click_result(result: Result | None, reason: str) -> None:
 def execute_from_structure(
     root: Path,
     mocks: dict[str, dict[str, Any] | None],
-    args: dict[str, str] | None,
+    args: dict[str, str | None] | list[str] | None,
     caplog: LogCaptureFixture,
     mocker: MockerFixture,
     runner: CliRunner,
     exception: Exception | None,
     logs: list[str] | None,
     output: list[str] | None,
-    pwd: Path,
+    pwd: Path | None = None,
+    coverage_paths: list[str] | None = None,
 ) -> Result | None:
-    """Execute a cellophane wrapper from a directory structure."""
-    # Extract --flag value pairs from args. If a value is None, the flag is
-    # considered to be a flag without a value.
-    _args = [p for f in (args or {}).items() for p in f if p is not None]
+    """Execute a cellophane wrapper from a directory structure.
+
+    Coverage data files written under root are appended to coverage_paths so
+    the caller can combine them once. If coverage_paths is not given, they are
+    combined immediately into a new data file in pwd (or the current working
+    directory).
+    """
+    _args = _flatten_args(args) if isinstance(args, dict) else args or []
     _handlers = [
         handler
         for handler in logging.getLogger().handlers.copy()
@@ -100,10 +126,14 @@ def execute_from_structure(
         if module.startswith("modules.") or module == "modules":
             del sys.modules[module]
 
-    cov = Coverage(data_file=pwd / f".coverage.{uuid4()}")
-    cov.combine(data_paths=[str(d) for d in root.glob(".coverage.*")])
+    _coverage_paths = [str(d) for d in root.glob(".coverage.*")]
+    if coverage_paths is not None:
+        coverage_paths.extend(_coverage_paths)
+    else:
+        cov = Coverage(data_file=(pwd or Path.cwd()) / f".coverage.{uuid4()}")
+        cov.combine(data_paths=_coverage_paths)
 
-    if repr(_exception) != (exception or repr(None)):
+    if repr(_exception) != (exception or _NONE_REPR):
         fail_from_click_result(
             result=_result,
             reason=(
@@ -114,8 +144,9 @@ def execute_from_structure(
             ),
         )
 
+    captured = "\n".join(caplog.messages)
     for log_line in logs or []:
-        if log_line not in (captured := "\n".join(caplog.messages)):
+        if log_line not in captured:
             fail_from_click_result(
                 result=_result,
                 reason=(
@@ -125,8 +156,10 @@ def execute_from_structure(
                 ),
             )
 
+    # Result.output decodes stdout on every access
+    _output = _result.output if _result else None
     for output_line in output or []:
-        if _result and output_line not in _result.output:
+        if _output is not None and output_line not in _output:
             fail_from_click_result(
                 result=_result,
                 reason=f"Command output not found\nMissing output:\n{output_line}",
@@ -135,20 +168,30 @@ def execute_from_structure(
     return _result
 
 
+@lru_cache(maxsize=None)
+def _load_yaml(path: Path, mtime: int) -> tuple[Any, ...]:
+    """Load all documents from a YAML file, cached by path and mtime."""
+    del mtime  # Only used as part of the cache key
+    return tuple(_YAML.load_all(path))
+
+
 def parametrize_from_yaml(paths: list[Path]) -> Callable:
     """Parametrize a test from a YAML file."""
 
     def wrapper(func: Callable) -> Callable:
-        return mark.parametrize(
-            "definition",
-            [
-                param(definition, id=definition.get("id", path.stem))
-                for path, documents in [(p, _YAML.load_all(p)) for p in paths]
-                for definitions in documents
+        params = []
+        for path in paths:
+            for definitions in _load_yaml(path, path.stat().st_mtime_ns):
                 for definition in (
                     definitions if isinstance(definitions, list) else [definitions]
-                )
-            ],
-        )(func)
+                ):
+                    # Copy to leave the cached definition untouched. The flattened
+                    # args are stored separately to keep "args" as in the YAML.
+                    definition = {
+                        **definition,
+                        "_args": _flatten_args(definition.get("args")),
+                    }
+                    params.append(param(definition, id=definition.get("id", path.stem)))
+        return mark.parametrize("definition", params)(func)
 
     return wrapper
@@ -1,7 +1,6 @@
 """Utilities to freeze/unfreeze data structures."""
 
-from functools import singledispatch
-from typing import Any
+from typing import Any, Callable
 
 from frozendict import frozendict
 
@@ -11,97 +10,118 @@ class frozenlist(tuple):
     """
 
 
-@singledispatch
-def freeze(data: Any) -> Any:
-    """Base freeze dispatch, returns the input object.
+def _identity(data: Any, *_: Any) -> Any:
+    return data
+
+
+def _dispatch(table: dict[type, Callable], type_: type) -> Callable:
+    """Find the handler for a type not yet in a dispatch table.
+
+    The nearest registered base class is used, and the result is stored in the
+    table so that subsequent lookups for the same type are a single dict get.
 
     Args:
     ----
-        data (Any): The object to freeze.
+        table (dict[type, Callable]): The dispatch table.
+        type_ (type): The type to find a handler for.
 
     Returns:
     -------
-        Any: Input data object
+        Callable: The handler for the type.
 
     """
-    return data
+    handler = next(
+        (table[base] for base in type_.__mro__ if base in table),
+        _identity,
+    )
+    table[type_] = handler
+    return handler
 
 
-@freeze.register
-def _(data: dict) -> frozendict:
-    """Freezes a dictionary.
+def freeze(data: Any) -> Any:
+    """Freeze dictionaries and lists, recursively.
+
+    Dictionaries are converted to frozendicts and lists to frozenlists. Other
+    objects are returned as-is. Containers that occur more than once in the
+    input (eg. YAML anchors) are only frozen once, and the frozen result is
+    shared. Frozendicts and frozenlists are assumed to be frozen already, and
+    are also returned as-is.
 
     Args:
     ----
-        data (dict): The dictionary to freeze.
+        data (Any): The object to freeze.
 
     Returns:
     -------
-        frozendict: The frozen dictionary.
+        Any: The frozen object.
 
     """
-    return frozendict({k: freeze(v) for k, v in data.items()})
+    return _freeze(data, {})
 
 
-@freeze.register
-def _(data: list | frozenlist) -> frozenlist:
-    """Freezes a list by converting to a tuple.
+def _freeze(data: Any, memo: dict[int, tuple[Any, Any]]) -> Any:
+    type_ = type(data)
+    return (_FREEZE.get(type_) or _dispatch(_FREEZE, type_))(data, memo)
 
-    Args:
-    ----
-        data (list | tuple): The list or tuple to freeze.
 
-    Returns:
-    -------
-        tuple: The frozen list or tuple.
-
-    """
-    return frozenlist(freeze(v) for v in data)
+def _freeze_dict(data: dict, memo: dict[int, tuple[Any, Any]]) -> frozendict:
+    if (cached := memo.get(id(data))) is None:
+        frozen = frozendict({k: _freeze(v, memo) for k, v in data.items()})
+        # Keep a reference to data so that its id cannot be reused
+        memo[id(data)] = cached = (data, frozen)
+    return cached[1]
 
 
-@singledispatch
-def unfreeze(data: Any) -> Any:
-    """Base unfreeze dispatch, returns the input object.
+def _freeze_list(
+    data: list | frozenlist,
+    memo: dict[int, tuple[Any, Any]],
+) -> frozenlist:
+    if (cached := memo.get(id(data))) is None:
+        frozen = frozenlist([_freeze(v, memo) for v in data])
+        memo[id(data)] = cached = (data, frozen)
+    return cached[1]
 
-    Args:
-    ----
-        data (Any): The object to unfreeze.
 
-    Returns:
-    -------
-        Any: Input data object
+_FREEZE: dict[type, Callable] = {
+    object: _identity,
+    dict: _freeze_dict,
+    list: _freeze_list,
+    frozendict: _identity,
+    frozenlist: _identity,
+}
 
-    """
-    return data
 
+def unfreeze(data: Any) -> Any:
+    """Unfreeze frozendicts and frozenlists, recursively.
 
-@unfreeze.register
-def _(data: dict | frozendict) -> dict:
-    """Unfreezes a dictionary.
+    Dictionaries (including frozendicts) are converted to dicts and lists
+    (including frozenlists) to lists. Other objects are returned as-is.
 
     Args:
     ----
-        data (dict | frozendict): The dictionary to unfreeze.
+        data (Any): The object to unfreeze.
 
     Returns:
     -------
-        dict: The unfrozen dictionary.
+        Any: The unfrozen object.
 
     """
-    return {k: unfreeze(v) for k, v in data.items()}
+    type_ = type(data)
+    return (_UNFREEZE.get(type_) or _dispatch(_UNFREEZE, type_))(data)
 
 
-@unfreeze.register
-def _(data: list | frozenlist) -> list:
-    """Unfreezes a frozenlist.
+def _unfreeze_dict(data: dict | frozendict) -> dict:
+    return {k: unfreeze(v) for k, v in data.items()}
 
-    Args:
-    ----
-        data (list | frozenlist): The list or tuple to unfreeze.
 
-    Returns:
-    -------
-        list: The unfrozen list.
-
-    """
+def _unfreeze_list(data: list | frozenlist) -> list:
     return [unfreeze(v) for v in data]
+
+
+_UNFREEZE: dict[type, Callable] = {
+    object: _identity,
+    dict: _unfreeze_dict,
+    frozendict: _unfreeze_dict,
+    list: _unfreeze_list,
+    frozenlist: _unfreeze_list,
+}
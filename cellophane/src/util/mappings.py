@@ -1,6 +1,8 @@
 """Unitility functions for working with mappings."""
 
-from typing import Any, Hashable
+from collections.abc import Mapping, Sequence
+from itertools import chain
+from typing import Any
 
 
 def map_nested_keys(
@@ -34,18 +36,15 @@ def map_nested_keys(
         ```
 
     """
-    if path is None:  # For the root node
-        path = ()
-
-    if not isinstance(node, dict) or len(node) == 0:
-        return (path,) if path else ()
-
     paths: list[tuple[str, ...]] = []
-    for key in node:
-        # Add the current key to the path
-        new_path = (*path, key)
-        # Recurse on child nodes and extend paths
-        paths.extend(map_nested_keys(node[key], new_path))
+    stack: list[tuple[Any, tuple[str, ...]]] = [(node, path or ())]
+    while stack:
+        node_, path_ = stack.pop()
+        if isinstance(node_, dict) and node_:
+            # Push children in reverse to preserve key order in the output
+            stack.extend((node_[k], (*path_, k)) for k in reversed(node_))
+        elif path_:
+            paths.append(path_)
 
     return tuple(paths)
 
@@ -77,16 +76,35 @@ def merge_mappings(m_1: Any, m_2: Any) -> Any:
         ```
 
     """
-    match m_1, m_2:
-        case {**m_1}, {**m_2} if not any(k in m_1 for k in m_2):
-            return m_1 | m_2
-        case {**m_1}, {**m_2}:
-            return {k: merge_mappings(v, m_2.get(k, v)) for k, v in (m_2 | m_1).items()}
-        case [[{**m_1}], [{**m_2}]]:
-            return [merge_mappings(m_1, m_2)]
-        case [[*m_1], [*m_2]] if all(isinstance(v, Hashable) for v in m_1 + m_2):
+    # NOTE: This used to be a match statement, but mapping patterns with
+    # {**rest} copy the subject into a new dict on every case probe.
+    if _is_mapping(m_1) and _is_mapping(m_2):
+        if not m_1.keys() & m_2.keys():
+            return {**m_1, **m_2}
+        # Only overlapping keys need to be merged recursively
+        merged = {
+            k: merge_mappings(m_1[k], v) if k in m_1 else v for k, v in m_2.items()
+        }
+        for k, v in m_1.items():
+            merged.setdefault(k, v)
+        return merged
+    if _is_sequence(m_1) and _is_sequence(m_2):
+        if len(m_1) == len(m_2) == 1 and _is_mapping(m_1[0]) and _is_mapping(m_2[0]):
+            return [merge_mappings(m_1[0], m_2[0])]
+        if all(v.__hash__ is not None for v in chain(m_1, m_2)):
             # dict is used to preserve order while removing duplicates
             # FIXME: Is this always the desired behavior?
-            return [*dict.fromkeys(m_1 + m_2)]
-        case _:
-            return m_2
+            return [*dict.fromkeys(chain(m_1, m_2))]
+    return m_2
+
+
+def _is_mapping(obj: Any) -> bool:
+    """Check if an object would match a mapping pattern (eg. {**_})."""
+    return isinstance(obj, (dict, Mapping))
+
+
+def _is_sequence(obj: Any) -> bool:
+    """Check if an object would match a sequence pattern (eg. [*_])."""
+    return isinstance(obj, (list, tuple)) or (
+        isinstance(obj, Sequence) and not isinstance(obj, (str, bytes, bytearray))
+    )
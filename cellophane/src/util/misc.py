@@ -49,17 +49,18 @@ class freeze_logs:
     """
 
     logger: logging.Logger = field(default=logging.root)
-    original_handlers: set[logging.Handler] = field(factory=set)
+    original_handlers: frozenset[logging.Handler] = field(factory=frozenset)
     original_level: int = field(default=logging.CRITICAL)
 
     def __enter__(self) -> None:
         self.original_level = self.logger.level
-        self.original_handlers = {*self.logger.handlers}
+        self.original_handlers = frozenset(self.logger.handlers)
         self.logger.setLevel(logging.CRITICAL + 1)
 
     def __exit__(self, *args: object, **kwargs: Any) -> None:
         del args, kwargs  # Unused
-        for handler in {*self.logger.handlers} ^ self.original_handlers:
-            handler.close()
-            self.logger.removeHandler(handler)
+        for handler in [*self.logger.handlers]:
+            if handler not in self.original_handlers:
+                handler.close()
+                self.logger.removeHandler(handler)
         self.logger.setLevel(self.original_level)
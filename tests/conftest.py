@@ -1 +1,35 @@
+import os
+import shutil
+from pathlib import Path
+from tempfile import mkdtemp
+
+from pytest import Config
+
 pytest_plugins = "cellophane.src.testing"
+
+_SHM = Path("/dev/shm")
+_SHM_PREFIX = "cellophane-pytest-"
+# tmpfs is backed by RAM, and every integration definition writes a full
+# wrapper tree, so only use it when there is plenty of room left
+_SHM_MIN_FREE = 1 << 30  # 1 GiB
+
+
+def pytest_configure(config: Config) -> None:
+    """Use tmpfs for temporary test directories when available.
+
+    Like pytest's own basetemp, the directories of the most recent runs are
+    kept for debugging (see tmp_path_retention_count) and older ones removed.
+    """
+    if (
+        config.option.basetemp is not None
+        or not _SHM.is_dir()
+        or shutil.disk_usage(_SHM).free < _SHM_MIN_FREE
+    ):
+        return
+
+    keep = int(config.getini("tmp_path_retention_count"))
+    previous = sorted(_SHM.glob(f"{_SHM_PREFIX}*"), key=os.path.getmtime)
+    for path in previous[: max(len(previous) - keep + 1, 0)]:
+        shutil.rmtree(path, ignore_errors=True)
+
+    config.option.basetemp = mkdtemp(prefix=_SHM_PREFIX, dir=_SHM)
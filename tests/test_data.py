@@ -1,6 +1,8 @@
 """Tests for the data module."""
 
 # pylint: disable=pointless-statement
+import gc
+import weakref
 from copy import deepcopy
 from pathlib import Path
 from typing import ClassVar
@@ -51,6 +53,9 @@ class Test_Container:
         with raises(TypeError):
             _container[1337] = 1337  # type: ignore[index]
 
+        with raises(TypeError):
+            _container["not an identifier"] = 1337
+
         with raises(TypeError):
             _container[1337]  # type: ignore[index]
 
@@ -84,6 +89,16 @@ class Test_Container:
         assert _dummy_ref.a is _dummy.a
         assert _dummy_copy.a is not _dummy.a
 
+    @staticmethod
+    def test_deepcopy_shared() -> None:
+        """Test that deepcopy keeps shared references shared."""
+        _shared = data.Container(b=1337)
+        _container = data.Container(a=_shared, c=[_shared])
+        _copy = deepcopy(_container)
+
+        assert _copy.a is _copy.c[0]
+        assert _copy.a is not _shared
+
     @staticmethod
     def test_as_dict() -> None:
         """Test as_dict."""
@@ -173,6 +188,20 @@ class Test_Sample:
         _pickle = dill.dumps(_sample)
         assert dill.loads(_pickle) == _sample
 
+    @staticmethod
+    def test_deepcopy() -> None:
+        """Test deepcopy."""
+        _sample = data.Sample(id="a", files=["b"], meta={"c": [1]})
+        _sample.fail("d")
+        _copy = deepcopy(_sample)
+        assert _copy == _sample
+        assert _copy.uuid == _sample.uuid
+        assert _copy.failed == "d"
+        _copy.files.append(Path("e"))
+        _copy.meta.c.append(2)
+        assert _sample.files == [Path("b")]
+        assert _sample.meta.c == [1]
+
     @staticmethod
     def test_with_mixins() -> None:
         """Test with_mixins."""
@@ -190,6 +219,7 @@ class Test_Sample:
 
         assert _sample_class is not data.Samples
         assert _sample_class.d == 1338
+        assert data.Sample.with_mixins([_mixin]) is _sample_class  # type: ignore[list-item]
 
         _sample = _sample_class(id="DUMMY", c=1339)
 
@@ -197,6 +227,27 @@ class Test_Sample:
         assert _sample.b == "World"
         assert _sample.c == 1339
 
+    @staticmethod
+    def test_with_mixins_released() -> None:
+        """Test that mixin classes are not kept alive indefinitely."""
+
+        def _make_mixin() -> type[data.Sample]:
+            @define(slots=False)
+            class _mixin(data.Sample):  # type: ignore[no-untyped-def]
+                a: str = "Hello"
+
+            return _mixin
+
+        _first = _make_mixin()
+        _ref = weakref.ref(_first)
+        data.Sample.with_mixins([_first])
+        del _first
+        for _ in range(64):
+            data.Sample.with_mixins([_make_mixin()])
+        gc.collect()
+
+        assert _ref() is None
+
     @staticmethod
     def test_slotted_mixin() -> None:
         """Test slotted mixin."""
@@ -242,9 +293,10 @@ class Test_Samples:
         assert samples
 
     @staticmethod
-    def test_from_file(samples: data.Samples[data.Sample]) -> None:
+    @mark.parametrize("name", ["samples.yaml", "samples.json"])
+    def test_from_file(samples: data.Samples[data.Sample], name: str) -> None:
         """Test from_file."""
-        _samples = data.Samples.from_file(LIB / "config" / "samples.yaml")
+        _samples = data.Samples.from_file(LIB / "config" / name)
         assert not {s.id for s in _samples} - {s.id for s in samples}
 
     @staticmethod
@@ -352,6 +404,16 @@ class Test_Samples:
 
         assert samples == _samples_unpickle
 
+    @staticmethod
+    def test_deepcopy(samples: data.Samples[data.Sample]) -> None:
+        """Test deepcopy."""
+        _copy = deepcopy(samples)
+        assert _copy == samples
+        assert type(_copy) is type(samples)  # pylint: disable=unidiomatic-typecheck
+        assert all(a is not b for a, b in zip(_copy, samples))
+        _copy.output.add(data.Output(src="a", dst="b"))
+        assert not samples.output
+
     @staticmethod
     def test_getitem_setitem() -> None:
         """Test __getitem__ and __setitem__."""
@@ -422,6 +484,12 @@ class Test_Samples:
 
         assert _samples_a1 & _samples_a2
 
+        _shared = deepcopy(_samples_a1[1])
+        _shared.files = [Path("a1_2_2")]
+        _samples_merge = _samples_a1 & _SamplesSubA([_shared, *_samples_a2])
+        assert [s.id for s in _samples_merge] == ["a1_1", "a1_2", "a2_1", "a2_2"]
+        assert _samples_merge[1].files == [Path("a1_2"), Path("a1_2_2")]
+
     @staticmethod
     def test_or() -> None:
         """Test __or__."""
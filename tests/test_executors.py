@@ -1,10 +1,16 @@
 """Test cellphane.src.executors."""
 
+import logging
+import os
+import subprocess as sp
 import time
+from contextlib import suppress
 from pathlib import Path
 from typing import Generator
 from unittest.mock import MagicMock
+from uuid import uuid4
 
+import psutil
 from pytest import LogCaptureFixture, fixture, raises
 from pytest_mock import MockerFixture
 
@@ -98,6 +104,85 @@ class Test_SubprocessExecutor:
         assert repr(exc.value) == "SystemExit(1)"
         assert "Command failed with exception: Exception('DUMMY')" in caplog.messages
 
+    @staticmethod
+    def test_log_file_error(
+        mocker: MockerFixture,
+        tmp_path: Path,
+        spe: executors.SubprocessExecutor,  # pylint: disable=redefined-outer-name
+    ) -> None:
+        """Test that log files are closed if opening another fails."""
+        _fd = os.open(os.devnull, os.O_WRONLY)
+        mocker.patch(
+            "cellophane.executors.subprocess_executor.os.open",
+            side_effect=[_fd, OSError("DUMMY")],
+        )
+        _popen = mocker.patch("cellophane.executors.subprocess_executor.sp.Popen")
+
+        with raises(OSError):
+            spe.target(
+                "true",
+                uuid=uuid4(),
+                workdir=tmp_path,
+                env={},
+                logger=MagicMock(),
+            )
+
+        assert not _popen.called
+        with raises(OSError):
+            os.fstat(_fd)
+
+    @staticmethod
+    def test_target_forgets_pid(
+        tmp_path: Path,
+        spe: executors.SubprocessExecutor,  # pylint: disable=redefined-outer-name
+    ) -> None:
+        """Test that the pid of a finished job is not kept."""
+        _uuid = uuid4()
+        with raises(SystemExit):
+            spe.target("true", uuid=_uuid, workdir=tmp_path, env={}, logger=MagicMock())
+
+        assert _uuid not in spe.pids
+        assert spe.terminate_hook(_uuid, MagicMock()) is None
+
+    @staticmethod
+    def test_terminate_hook_no_such_process(
+        spe: executors.SubprocessExecutor,  # pylint: disable=redefined-outer-name
+    ) -> None:
+        """Test terminate_hook for a process that has already exited."""
+        _proc = sp.Popen(["true"])
+        _proc.wait()
+        _uuid = uuid4()
+        spe.pids[_uuid] = _proc.pid
+
+        assert spe.terminate_hook(_uuid, MagicMock()) is None
+
+    @staticmethod
+    def test_terminate_hook_kill(
+        mocker: MockerFixture,
+        caplog: LogCaptureFixture,
+        spe: executors.SubprocessExecutor,  # pylint: disable=redefined-outer-name
+    ) -> None:
+        """Test that processes ignoring SIGTERM are killed."""
+        _proc = sp.Popen(["sh", "-c", "trap '' TERM; sleep 60 & wait"])
+        time.sleep(0.2)  # Let the shell set up the trap and start the child
+        _child = psutil.Process(_proc.pid).children()[0]
+        _uuid = uuid4()
+        spe.pids[_uuid] = _proc.pid
+        _wait_procs = psutil.wait_procs
+        mocker.patch(
+            "cellophane.executors.subprocess_executor.psutil.wait_procs",
+            side_effect=lambda procs, timeout: _wait_procs(procs, timeout=0.5),
+        )
+
+        with caplog.at_level("DEBUG"):
+            spe.terminate_hook(_uuid, logging.LoggerAdapter(logging.getLogger(), {}))
+
+        assert f"Killing process (pid={_proc.pid})" in caplog.messages
+        assert f"Killing process (pid={_child.pid})" in caplog.messages
+        for _pid in (_proc.pid, _child.pid):
+            with suppress(psutil.NoSuchProcess):
+                assert psutil.Process(_pid).status() == psutil.STATUS_ZOMBIE
+
     @staticmethod
     def test_wait_for_uuid(
         spe: executors.SubprocessExecutor,  # pylint: disable=redefined-outer-name
@@ -11,7 +11,7 @@ from typing import Any, Callable
 from unittest.mock import MagicMock
 
 from graphlib import CycleError
-from psutil import Process, TimeoutExpired
+from psutil import Process, wait_procs
 from pytest import LogCaptureFixture, mark, param, raises
 from pytest_mock import MockerFixture
 
@@ -57,9 +57,13 @@ class Test__cleanup:
         )
 
         if timeout:
+            # Processes ignore SIGTERM and outlive the grace period
+            mocker.patch("cellophane.src.modules.runner_.Process.terminate")
             mocker.patch(
-                "cellophane.src.modules.runner_.Process.terminate",
-                side_effect=TimeoutExpired(10),
+                "cellophane.src.modules.runner_.wait_procs",
+                side_effect=lambda p, timeout=None: (
+                    ([], p) if timeout else wait_procs(p)
+                ),
             )
 
         assert all(p.poll() is None for p in procs)
@@ -270,6 +274,14 @@ class Test__resolve_dependencies:
                 ["a"],
                 id="single",
             ),
+            param(
+                [
+                    modules.pre_hook()(func("a")),
+                    modules.post_hook()(func("b")),
+                ],
+                ["a", "b"],
+                id="no_dependencies",
+            ),
             param(
                 [
                     modules.pre_hook()(func("a")),
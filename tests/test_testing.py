@@ -0,0 +1,113 @@
+"""Test cellophane.src.testing."""
+
+import os
+from pathlib import Path
+
+from click.testing import CliRunner
+from pytest import LogCaptureFixture
+from pytest_mock import MockerFixture
+
+from cellophane.src import testing
+
+
+class Test_create_structure:
+    """Test create_structure."""
+
+    @staticmethod
+    def test_create_structure(tmp_path: Path) -> None:
+        """Test that nested structures are written with executable files."""
+        (tmp_path / "schema.yaml").write_text("existing: true\n")
+
+        testing.create_structure(
+            root=tmp_path,
+            structure={
+                "a.txt": "A",
+                "b": {"c.txt": "C", "d": {"e.txt": "E"}},
+            },
+            external_root=tmp_path,
+        )
+
+        assert (tmp_path / "modules").is_dir()
+        assert (tmp_path / "schema.yaml").read_text() == "existing: true\n"
+        assert (tmp_path / "a.txt").read_text() == "A"
+        assert (tmp_path / "b" / "c.txt").read_text() == "C"
+        assert (tmp_path / "b" / "d" / "e.txt").read_text() == "E"
+        for path in ("a.txt", "b/c.txt", "b/d/e.txt"):
+            assert (tmp_path / path).stat().st_mode & 0o777 == 0o755
+        for path in ("b", "b/d"):
+            assert not (tmp_path / path / "modules").exists()
+            assert not (tmp_path / path / "schema.yaml").exists()
+
+    @staticmethod
+    def test_create_structure_external(tmp_path: Path) -> None:
+        """Test that relative external sources are resolved and normalized."""
+        root = tmp_path / "root"
+        external_root = tmp_path / "a" / "b"
+        root.mkdir()
+        external_root.mkdir(parents=True)
+        (tmp_path / "a" / "data").mkdir()
+
+        testing.create_structure(
+            root=root,
+            structure={},
+            external_root=external_root,
+            external={"../data": "data", str(tmp_path / "a" / "data"): "abs"},
+        )
+
+        assert os.readlink(root / "data") == str((tmp_path / "a" / "data").resolve())
+        assert os.readlink(root / "abs") == str(tmp_path / "a" / "data")
+
+
+class Test_execute_from_structure:
+    """Test execute_from_structure."""
+
+    @staticmethod
+    def test_execute_from_structure_pwd(
+        tmp_path: Path,
+        caplog: LogCaptureFixture,
+        mocker: MockerFixture,
+    ) -> None:
+        """Test that coverage data is combined into pwd without coverage_paths."""
+        root = tmp_path / "root"
+        pwd = tmp_path / "pwd"
+        root.mkdir()
+        pwd.mkdir()
+        testing.create_structure(root=root, structure={}, external_root=tmp_path)
+        mock_coverage = mocker.patch("cellophane.src.testing.util.Coverage")
+
+        result = testing.execute_from_structure(
+            root=root,
+            mocks={},
+            args=["--help"],
+            caplog=caplog,
+            mocker=mocker,
+            runner=CliRunner(),
+            exception=None,
+            logs=None,
+            output=None,
+            pwd=pwd,
+        )
+
+        assert result is not None and result.exit_code == 0
+        assert mock_coverage.call_args.kwargs["data_file"].parent == pwd
+        mock_coverage.return_value.combine.assert_called_once()
+
+
+class Test_parametrize_from_yaml:
+    """Test parametrize_from_yaml."""
+
+    @staticmethod
+    def test_parametrize_from_yaml(tmp_path: Path) -> None:
+        """Test that args are kept as in the YAML, with a flattened copy."""
+        path = tmp_path / "definition.yaml"
+        path.write_text("id: DUMMY\nargs:\n  --flag: value\n  --switch: null\n")
+
+        @testing.parametrize_from_yaml([path])
+        def _test(definition: dict) -> None:
+            del definition  # Unused
+
+        _mark = _test.pytestmark[0]  # type: ignore[attr-defined]
+        (definition,) = _mark.args[1][0].values
+
+        assert definition["args"] == {"--flag": "value", "--switch": None}
+        assert definition["_args"] == ["--flag", "value", "--switch"]
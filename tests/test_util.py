@@ -1,8 +1,10 @@
 """Test cellophane.src.util."""
 
-from collections import UserList
+import logging
+from collections import OrderedDict, UserList
 from typing import Any, Callable
 
+from frozendict import frozendict
 from pytest import mark, param
 
 from cellophane.src import data, modules, util
@@ -20,6 +22,12 @@ class Test_map_nested_keys:
                 (("a", "b", "c"), ("a", "b", "d"), ("a", "e"), ("f",)),
                 id="nested dict",
             ),
+            param({}, (), id="empty dict"),
+            param(
+                {"a": {}, "b": {"c": {}}},
+                (("a",), ("b", "c")),
+                id="empty nested dict",
+            ),
             # FIXME: Add more test cases
         ],
     )
@@ -28,6 +36,68 @@ class Test_map_nested_keys:
         assert util.map_nested_keys(data_) == expected
 
 
+class Test_freeze:
+    """Test freeze and unfreeze."""
+
+    @staticmethod
+    @mark.parametrize(
+        "data_,expected",
+        [
+            param(1, 1, id="int"),
+            param("a", "a", id="str"),
+            param(
+                {"a": [1, {"b": 2}]},
+                frozendict({"a": util.frozenlist((1, frozendict({"b": 2})))}),
+                id="nested dict",
+            ),
+            param(
+                [[1], {"a": 2}],
+                util.frozenlist((util.frozenlist((1,)), frozendict({"a": 2}))),
+                id="nested list",
+            ),
+            param(
+                OrderedDict(a=[1]),
+                frozendict({"a": util.frozenlist((1,))}),
+                id="dict subclass",
+            ),
+        ],
+    )
+    def test_freeze(data_: Any, expected: Any) -> None:
+        """Test freeze."""
+        frozen = util.freeze(data_)
+        assert frozen == expected
+        assert type(frozen) is type(expected)  # pylint: disable=unidiomatic-typecheck
+
+    @staticmethod
+    def test_freeze_shared() -> None:
+        """Test that shared subtrees are frozen once."""
+        shared = {"a": [1, 2]}
+        frozen = util.freeze({"x": shared, "y": [shared]})
+        assert frozen["x"] is frozen["y"][0]
+
+    @staticmethod
+    def test_freeze_frozen() -> None:
+        """Test that already frozen data is returned as-is."""
+        frozen = util.freeze({"a": [1, {"b": 2}]})
+        assert util.freeze(frozen) is frozen
+        assert util.freeze(frozen["a"]) is frozen["a"]
+
+    @staticmethod
+    @mark.parametrize(
+        "data_",
+        [
+            param(1, id="int"),
+            param({"a": [1, {"b": 2}]}, id="nested dict"),
+            param([[1], {"a": [2]}], id="nested list"),
+        ],
+    )
+    def test_unfreeze(data_: Any) -> None:
+        """Test that unfreeze reverses freeze."""
+        unfrozen = util.unfreeze(util.freeze(data_))
+        assert unfrozen == data_
+        assert type(unfrozen) is type(data_)  # pylint: disable=unidiomatic-typecheck
+
+
 class Test_merge_mappings:
     """Test merge_mappings."""
 
@@ -53,6 +123,12 @@ class Test_merge_mappings:
                 {"a": ["b", "c", "d", "e"]},
                 id="list, list",
             ),
+            param(
+                {"a": [1, [2]]},
+                {"a": [3]},
+                {"a": [3]},
+                id="unhashable list, list",
+            ),
             param(
                 {"a": {"b": {"c": [1, 3]}}},
                 {"a": {"b": {"c": [3, 7]}}},
@@ -65,12 +141,46 @@ class Test_merge_mappings:
                 {"a": [{"b": 1, "c": 2}]},
                 id="nested list, nested list",
             ),
+            param(
+                {"a": 1, "b": {"c": [1]}},
+                {"b": {"c": [2]}, "d": 2},
+                {"a": 1, "b": {"c": [1, 2]}, "d": 2},
+                id="overlapping keys",
+            ),
+            param(
+                {"a": {"b": 1}},
+                {"c": {"d": 2}},
+                {"a": {"b": 1}, "c": {"d": 2}},
+                id="non-overlapping keys",
+            ),
         ],
     )
     def test_merge_mappings(m_1: dict, m_2: dict, expected: dict) -> None:
         """Test merge_mappings."""
         assert util.merge_mappings(m_1, m_2) == expected
 
+    @staticmethod
+    @mark.parametrize(
+        "m_1,m_2,expected",
+        [
+            param(
+                {"a": 1, "b": 2},
+                {"c": 3},
+                ["a", "b", "c"],
+                id="non-overlapping keys",
+            ),
+            param(
+                {"a": 1, "b": 2},
+                {"b": 3, "c": 4},
+                ["b", "c", "a"],
+                id="overlapping keys",
+            ),
+        ],
+    )
+    def test_merge_mappings_key_order(m_1: dict, m_2: dict, expected: list) -> None:
+        """Test that merge_mappings preserves key order."""
+        assert [*util.merge_mappings(m_1, m_2)] == expected
+
 
 class Test__instance_or_subclass:
     """Test _is_instance_or_subclass function."""
@@ -107,3 +217,24 @@ class Test__instance_or_subclass:
     ) -> None:
         """Test _is_instance_or_subclass function."""
         assert util.is_instance_or_subclass(obj, cls) == expected
+
+
+class Test_freeze_logs:
+    """Test freeze_logs."""
+
+    @staticmethod
+    def test_freeze_logs() -> None:
+        """Test that added handlers are removed and the level is restored."""
+        logger = logging.getLogger("test_freeze_logs")
+        logger.setLevel(logging.INFO)
+        original = logging.NullHandler()
+        added = logging.NullHandler()
+        logger.addHandler(original)
+
+        with util.freeze_logs(logger):
+            assert logger.level > logging.CRITICAL
+            logger.addHandler(added)
+
+        assert logger.handlers == [original]
+        assert logger.level == logging.INFO
+        logger.removeHandler(original)